@@ -1,81 +1,201 @@
+import argparse
 import configparser
-import pandas as pd
-import matplotlib.pyplot as plt
+import csv
+import functools
+import json
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 # ----------------------------------------------------------------------------
 # TEIL 1: ERWEITERTE KLASSENSTRUKTUR
 # ----------------------------------------------------------------------------
 
+_KEIN_FALLBACK = object()
+
+# Format des INI-Caches; erhöhen, sobald sich _lese_ini oder die Cache-Struktur ändert
+_INI_CACHE_VERSION = 2
+
+# Rückfall-Profil für fehlende Lastprofile; wird von allen betroffenen Erzeugern geteilt
+_GLEICHVERTEILUNG_MONATE = np.full(12, 1/12)
+_GLEICHVERTEILUNG_MONATE.flags.writeable = False
+
+class IniAbschnitt(dict):
+    """Ein INI-Abschnitt als dict, mit derselben get/getint/getfloat-API wie SectionProxy."""
+    def __init__(self, name, werte):
+        super().__init__(werte)
+        self.name = name
+
+    def get(self, option, fallback=None):
+        return super().get(option, fallback)
+
+    def _hole(self, option, umwandlung, fallback):
+        if option not in self:
+            if fallback is _KEIN_FALLBACK:
+                raise configparser.NoOptionError(option, self.name)
+            return fallback
+        return umwandlung(self[option])
+
+    def getint(self, option, fallback=_KEIN_FALLBACK):
+        return self._hole(option, int, fallback)
+
+    def getfloat(self, option, fallback=_KEIN_FALLBACK):
+        return self._hole(option, float, fallback)
+
+def _lese_profil(profil_datei: str) -> np.ndarray:
+    """Liest die Spalte 'Prozent' einer Lastprofil-CSV als Anteile (Summe 1), genau 12 Monate.
+
+    Das Array wird von allen Komponenten mit derselben profil_id geteilt und ist
+    deshalb schreibgeschützt.
+    """
+    with open(profil_datei, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        try:
+            spalte = [name.strip() for name in next(reader, [])].index('Prozent')
+            werte = []
+            for zeile in reader:
+                if not zeile:
+                    continue
+                if len(zeile) <= spalte:
+                    raise ValueError(f"Zeile {reader.line_num} hat keine Spalte 'Prozent'")
+                werte.append(float(zeile[spalte]))
+        except csv.Error as e:
+            # csv.Error ist kein ValueError; wie die übrigen Formatfehler melden
+            raise ValueError(f"Zeile {reader.line_num}: {e}") from e
+    if len(werte) != 12:
+        raise ValueError(f"{len(werte)} Monatswerte statt 12")
+    profil = np.array(werte, dtype=np.float64) / 100
+    profil.flags.writeable = False
+    return profil
+
+def _lese_ini(ini_datei: Path) -> dict:
+    """Liest eine INI-Datei in {abschnitt: {schluessel: wert}}, ohne configparser.
+
+    Unterstützt das Format in anlage/ mit denselben Regeln wie configparser (strict):
+    [Abschnitte], 'schluessel = wert' oder 'schluessel: wert', ganze Kommentarzeilen
+    mit ';' oder '#', kleingeschriebene Schlüssel und [DEFAULT]-Werte, die in jeden
+    Abschnitt übernommen werden. Doppelte Abschnitte oder Schlüssel sind Fehler.
+    Fortsetzungszeilen und Interpolation gibt es nicht.
+    """
+    pfad = str(ini_datei)
+    abschnitte = {}
+    standard = {}
+    aktuell = None
+    name = None
+    with ini_datei.open('r', encoding='utf-8') as fp:
+        for nr, zeile in enumerate(fp, start=1):
+            zeile = zeile.strip()
+            if not zeile or zeile[0] in ';#':
+                continue
+            if zeile[0] == '[' and zeile[-1] == ']':
+                name = zeile[1:-1].strip()
+                if name == configparser.DEFAULTSECT:
+                    aktuell = standard
+                elif name in abschnitte:
+                    raise configparser.DuplicateSectionError(name, pfad, nr)
+                else:
+                    aktuell = abschnitte[name] = {}
+                continue
+            if aktuell is None:
+                raise configparser.MissingSectionHeaderError(pfad, nr, zeile)
+            # Wie configparser: das erste '=' oder ':' trennt Schlüssel und Wert
+            trenner = min((i for i in (zeile.find('='), zeile.find(':')) if i >= 0), default=-1)
+            if trenner < 0:
+                fehler = configparser.ParsingError(pfad)
+                fehler.append(nr, zeile)
+                raise fehler
+            schluessel = zeile[:trenner].strip().lower()
+            if schluessel in aktuell:
+                raise configparser.DuplicateOptionError(name, schluessel, pfad, nr)
+            aktuell[schluessel] = zeile[trenner + 1:].strip()
+    if standard:
+        abschnitte = {abschnitt: {**standard, **werte} for abschnitt, werte in abschnitte.items()}
+    return abschnitte
+
 class AnlagenKomponente:
     """Basis-Klasse, berechnet Investitionskosten."""
+    wartungssatz_pa = 0.0
+
     def __init__(self, config_allgemein):
         self.name = config_allgemein.get('name')
         self.lebensdauer = config_allgemein.getint('lebensdauer_jahre')
         self.spez_invest_eur_kw = config_allgemein.getfloat('spezifische_investitionskosten_eur_pro_kw', fallback=0) \
                                    or config_allgemein.getfloat('spezifische_investitionskosten_eur_pro_kwp', fallback=0)
         self.investitionskosten = 0.0
+        self.abschreibung_pa = 0.0
+        self.wartung_pa = 0.0
 
-    def get_abschreibung_pa(self) -> float:
-        return self.investitionskosten / self.lebensdauer if self.lebensdauer > 0 else 0
+    def _finalisiere_kosten(self):
+        """Berechnet die jährlichen Kosten einmalig, nachdem investitionskosten gesetzt ist."""
+        self.abschreibung_pa = self.investitionskosten / self.lebensdauer if self.lebensdauer > 0 else 0.0
+        self.wartung_pa = self.investitionskosten * self.wartungssatz_pa
 
 class Elektrolyseur(AnlagenKomponente):
     """Klasse für Elektrolyseure."""
+    wartungssatz_pa = 0.015
+
     def __init__(self, config_allgemein, config_verbrauch, config_produktion):
         super().__init__(config_allgemein)
         self.nennleistung_kw = config_verbrauch.getfloat('nennleistung_kw')
         self.strombedarf_kwh_pa = config_verbrauch.getfloat('strombedarf_kwh_pa')
         self.h2_produktionsrate_kg_h = config_produktion.getfloat('h2_produktionsrate_kg_h')
         self.investitionskosten = self.spez_invest_eur_kw * self.nennleistung_kw
-
-    def get_wartung_pa(self) -> float:
-        return self.investitionskosten * 0.015
+        self._finalisiere_kosten()
 
 class EnergieErzeuger(AnlagenKomponente):
     """Übergeordnete Klasse für alle Energieerzeuger."""
-    def __init__(self, config_allgemein, config_produktion, lastprofile_pfad):
+    def __init__(self, config_allgemein, config_produktion, lastprofile_pfad, profil_cache: dict):
         super().__init__(config_allgemein)
         profil_id = config_produktion.get('profil_id')
-        try:
-            profil_datei = lastprofile_pfad / f"{profil_id}.csv"
-            # Lese die Prozentwerte und stelle sicher, dass sie 100% ergeben
-            self.monatsprofil = pd.read_csv(profil_datei)['Prozent'] / 100
-        except FileNotFoundError:
+        profil_datei = lastprofile_pfad / f"{profil_id}.csv"
+        if profil_id in profil_cache:
+            self.monatsprofil = profil_cache[profil_id]
+        elif profil_datei.is_file():
+            # Lese die Prozentwerte; eine unlesbare Datei wirft ValueError und verwirft die Komponente
+            self.monatsprofil = profil_cache[profil_id] = _lese_profil(str(profil_datei))
+        else:
             print(f"FEHLER: Profildatei '{profil_datei}' nicht gefunden! Verwende gleichmäßige Verteilung.")
-            self.monatsprofil = pd.Series([1/12] * 12)
+            self.monatsprofil = _GLEICHVERTEILUNG_MONATE
 
-    def get_monatliche_produktion_kwh(self) -> pd.Series:
+    def get_jahresproduktion_kwh(self) -> float:
         raise NotImplementedError("Diese Methode muss in der Unterklasse implementiert werden.")
 
+    def get_monatliche_produktion_kwh(self) -> np.ndarray:
+        return self.get_jahresproduktion_kwh() * self.monatsprofil
+
 class Windkraftanlage(EnergieErzeuger):
     """Spezifische Implementierung für Windkraft."""
-    def __init__(self, config_allgemein, config_produktion, lastprofile_pfad):
-        super().__init__(config_allgemein, config_produktion, lastprofile_pfad)
+    wartungssatz_pa = 0.02
+
+    def __init__(self, config_allgemein, config_produktion, lastprofile_pfad, profil_cache: dict):
+        super().__init__(config_allgemein, config_produktion, lastprofile_pfad, profil_cache)
         self.nennleistung_kw = config_produktion.getfloat('nennleistung_kw')
         self.vollaststunden_pa = config_produktion.getfloat('vollaststunden_pa')
         self.investitionskosten = self.spez_invest_eur_kw * self.nennleistung_kw
+        self._finalisiere_kosten()
     
-    def get_monatliche_produktion_kwh(self) -> pd.Series:
-        jahresproduktion = self.nennleistung_kw * self.vollaststunden_pa
-        return jahresproduktion * self.monatsprofil
-
-    def get_wartung_pa(self) -> float:
-        return self.investitionskosten * 0.02
+    def get_jahresproduktion_kwh(self) -> float:
+        return self.nennleistung_kw * self.vollaststunden_pa
 
 class PVAnlage(EnergieErzeuger):
     """Spezifische Implementierung für PV."""
-    def __init__(self, config_allgemein, config_produktion, lastprofile_pfad):
-        super().__init__(config_allgemein, config_produktion, lastprofile_pfad)
+    wartungssatz_pa = 0.015
+
+    def __init__(self, config_allgemein, config_produktion, lastprofile_pfad, profil_cache: dict):
+        super().__init__(config_allgemein, config_produktion, lastprofile_pfad, profil_cache)
         self.nennleistung_kwp = config_produktion.getfloat('nennleistung_kwp')
         self.sonneneinstrahlung_kwh_kwp = config_produktion.getfloat('sonneneinstrahlung_kwh_kwp')
         self.investitionskosten = self.spez_invest_eur_kw * self.nennleistung_kwp
+        self._finalisiere_kosten()
 
-    def get_monatliche_produktion_kwh(self) -> pd.Series:
-        jahresproduktion = self.nennleistung_kwp * self.sonneneinstrahlung_kwh_kwp
-        return jahresproduktion * self.monatsprofil
-
-    def get_wartung_pa(self) -> float:
-        return self.investitionskosten * 0.015
+    def get_jahresproduktion_kwh(self) -> float:
+        return self.nennleistung_kwp * self.sonneneinstrahlung_kwh_kwp
 
 # ----------------------------------------------------------------------------
 # TEIL 2: DAS HAUPTPROJEKT MIT MONATLICHER ANALYSE
@@ -86,77 +206,177 @@ class WasserstoffProjekt:
         self.anlagen_pfad = anlagen_pfad
         self.lastprofile_pfad = lastprofile_pfad
         self.alle_komponenten = []
+        self.elektrolyseure = []
+        self.erzeuger = []
+        self.cache_datei = anlagen_pfad / '.ini_cache.json'
+        # Lastprofile je profil_id, beim ersten Erzeuger mit dieser ID gelesen
+        self._profile_cache = {}
         self._parse_projekt_struktur()
 
+    def _lade_ini_cache(self) -> dict:
+        """Liest den Cache {pfad: (mtime_ns, groesse, abschnitte)}; ungültige Einträge werden verworfen.
+
+        Eine Datei mit anderer oder fehlender Version gilt als leerer Cache.
+        """
+        try:
+            with self.cache_datei.open('r', encoding='utf-8') as f:
+                roh = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(roh, dict) or roh.get('version') != _INI_CACHE_VERSION:
+            return {}
+        dateien = roh.get('dateien')
+        if not isinstance(dateien, dict):
+            return {}
+        return {pfad: tuple(eintrag) for pfad, eintrag in dateien.items() if self._ist_cache_eintrag(eintrag)}
+
+    @staticmethod
+    def _ist_cache_eintrag(eintrag) -> bool:
+        """Prüft die Form [mtime_ns, groesse, {abschnitt: {schluessel: wert}}]."""
+        if not (isinstance(eintrag, list) and len(eintrag) == 3):
+            return False
+        mtime_ns, groesse, abschnitte = eintrag
+        return (type(mtime_ns) is int and type(groesse) is int and isinstance(abschnitte, dict)
+                and all(isinstance(werte, dict) and all(isinstance(w, str) for w in werte.values())
+                        for werte in abschnitte.values()))
+
+    def _speichere_ini_cache(self, cache: dict):
+        try:
+            with self.cache_datei.open('w', encoding='utf-8') as f:
+                json.dump({'version': _INI_CACHE_VERSION, 'dateien': cache}, f, ensure_ascii=False)
+        except OSError as e:
+            print(f"  -> WARNUNG: INI-Cache konnte nicht geschrieben werden: {e}")
+
+    @staticmethod
+    def _lese_ini_gecacht(ini_file: Path, cache: dict) -> tuple:
+        """Liefert (mtime_ns, groesse, abschnitte), aus dem Cache falls die Datei unverändert ist."""
+        st = ini_file.stat()
+        eintrag = cache.get(str(ini_file))
+        if eintrag is not None and eintrag[:2] == (st.st_mtime_ns, st.st_size):
+            return eintrag
+        return (st.st_mtime_ns, st.st_size, _lese_ini(ini_file))
+
     def _parse_projekt_struktur(self):
         # ... (Parser bleibt fast gleich, ruft aber neue Klassen auf)
         print("--- Lese Projektstruktur ---")
-        config = configparser.ConfigParser()
-        for typ_ordner in self.anlagen_pfad.iterdir():
-            if not typ_ordner.is_dir(): continue
-            
-            typ = typ_ordner.name
-            for ini_file in typ_ordner.glob('*.ini'):
+        alter_cache = self._lade_ini_cache()
+        neuer_cache = {}
+        dateien = []
+        # os.scandir liefert den Dateityp aus dem Verzeichniseintrag; stat() nur für Symlinks
+        with os.scandir(self.anlagen_pfad) as ordner_eintraege:
+            for typ_ordner in ordner_eintraege:
+                if not typ_ordner.is_dir(): continue
+                with os.scandir(typ_ordner.path) as datei_eintraege:
+                    dateien.extend((typ_ordner.name, Path(f.path)) for f in datei_eintraege
+                                   if f.name.endswith('.ini') and f.is_file())
+
+        # Dateizugriff und Parsen parallel, Objekte danach seriell in fester Reihenfolge anlegen
+        with ThreadPoolExecutor(max_workers=max(1, min(32, len(dateien)))) as ex:
+            futures = [ex.submit(self._lese_ini_gecacht, ini_file, alter_cache) for _, ini_file in dateien]
+
+            for (typ, ini_file), future in zip(dateien, futures):
                 try:
-                    config.read(ini_file)
-                    allgemein = config['Allgemein']
-                    produktion = config['Produktion']
+                    eintrag = future.result()
+                    neuer_cache[str(ini_file)] = eintrag
+                    abschnitte = eintrag[2]
+
+                    allgemein = IniAbschnitt('Allgemein', abschnitte['Allgemein'])
+                    produktion = IniAbschnitt('Produktion', abschnitte['Produktion'])
                     
                     if typ == 'elektrolyseure':
-                        komponente = Elektrolyseur(allgemein, config['Verbrauch'], produktion)
+                        komponente = Elektrolyseur(allgemein, IniAbschnitt('Verbrauch', abschnitte['Verbrauch']), produktion)
+                        self.elektrolyseure.append(komponente)
                     elif typ == 'windkraft':
-                        komponente = Windkraftanlage(allgemein, produktion, self.lastprofile_pfad)
+                        komponente = Windkraftanlage(allgemein, produktion, self.lastprofile_pfad, self._profile_cache)
+                        self.erzeuger.append(komponente)
                     elif typ == 'pv':
-                        komponente = PVAnlage(allgemein, produktion, self.lastprofile_pfad)
+                        komponente = PVAnlage(allgemein, produktion, self.lastprofile_pfad, self._profile_cache)
+                        self.erzeuger.append(komponente)
                     else:
                         continue
                         
                     self.alle_komponenten.append(komponente)
                     print(f"  -> '{komponente.name}' geladen.")
-                except Exception as e:
+                except (OSError, configparser.Error, KeyError, ValueError) as e:
                     print(f"  -> FEHLER bei {ini_file.name}: {e}")
 
-    def starte_monatliche_analyse(self):
-        elektrolyseure = [k for k in self.alle_komponenten if isinstance(k, Elektrolyseur)]
-        erzeuger = [k for k in self.alle_komponenten if isinstance(k, EnergieErzeuger)]
+        if neuer_cache != alter_cache:
+            self._speichere_ini_cache(neuer_cache)
+
+        self._baue_soa()
+
+    def _baue_soa(self):
+        """Legt die Kostenfelder aller Komponenten als zusammenhängende float64-Arrays ab."""
+        komponenten = self.alle_komponenten
+        n = len(komponenten)
+        self.invest = np.fromiter((k.investitionskosten for k in komponenten), dtype=np.float64, count=n)
+        self.abschr = np.fromiter((k.abschreibung_pa for k in komponenten), dtype=np.float64, count=n)
+        self.wartung = np.fromiter((k.wartung_pa for k in komponenten), dtype=np.float64, count=n)
+        # Erzeuger: Jahresproduktion als (N,)-Vektor, Profile als (N, 12)-Matrix
+        # (_lese_profil lässt nur Profile mit genau 12 Werten durch)
+        self.jahresproduktion = np.fromiter((k.get_jahresproduktion_kwh() for k in self.erzeuger),
+                                            dtype=np.float64, count=len(self.erzeuger))
+        self.profile = np.stack([k.monatsprofil for k in self.erzeuger]) if self.erzeuger else np.empty((0, 12))
+        # Aus den alten Arrays abgeleitete Kosten verwerfen
+        self.__dict__.pop('kosten_jahr', None)
+
+    @functools.cached_property
+    def kosten_jahr(self) -> dict:
+        """Gesamtinvestition und jährliche Kostenpositionen, aus den SoA-Arrays berechnet.
+
+        Der Wert wird beim ersten Zugriff festgehalten; `_baue_soa()` verwirft ihn.
+        """
+        gesamte_investition = float(self.invest.sum())
+        return {
+            'Gesamtinvestition': gesamte_investition,
+            'Kosten_pa': {
+                'Abschreibung': float(self.abschr.sum()),
+                'Wartung': float(self.wartung.sum()),
+                'Zinsen (Annahme)': gesamte_investition * 0.5 * 0.07,
+                # Hier könnten Kosten für Netzbezug etc. hinzukommen
+            },
+        }
+
+    def starte_monatliche_analyse(self, plot: bool = True):
+        elektrolyseure = self.elektrolyseure
 
         if not elektrolyseure:
             print("FEHLER: Kein Elektrolyseur für Analyse gefunden.")
             return
         
         # 1. Berechne monatliche Erzeugung und Verbrauch
-        monatliche_erzeugung = sum(k.get_monatliche_produktion_kwh() for k in erzeuger)
+        monatliche_erzeugung = self.jahresproduktion @ self.profile
         monatlicher_bedarf = elektrolyseure[0].strombedarf_kwh_pa / 12
 
-        # 2. Erstelle ein DataFrame für die Analyse
-        df = pd.DataFrame({
-            'Erzeugung': monatliche_erzeugung,
-            'Bedarf_Elektrolyseur': monatlicher_bedarf
-        })
-        df.index = ['Jan', 'Feb', 'Mär', 'Apr', 'Mai', 'Jun', 'Jul', 'Aug', 'Sep', 'Okt', 'Nov', 'Dez']
+        # 2. Bilanz auf NumPy-Arrays (12 Monate) rechnen
+        erzeugung = monatliche_erzeugung
+        bedarf = np.full(12, monatlicher_bedarf)
+        selbstversorgung = np.minimum(erzeugung, bedarf)
+        ueberschuss = np.maximum(erzeugung - bedarf, 0.0)
+        defizit = np.maximum(bedarf - erzeugung, 0.0)
 
-        df['Selbstversorgung'] = df[['Erzeugung', 'Bedarf_Elektrolyseur']].min(axis=1)
-        df['Netzeinspeisung_Ueberschuss'] = (df['Erzeugung'] - df['Bedarf_Elektrolyseur']).clip(lower=0)
-        df['Netzbezug_Defizit'] = (df['Bedarf_Elektrolyseur'] - df['Erzeugung']).clip(lower=0)
+        bilanz = {
+            'Erzeugung': erzeugung,
+            'Bedarf_Elektrolyseur': bedarf,
+            'Selbstversorgung': selbstversorgung,
+            'Netzeinspeisung_Ueberschuss': ueberschuss,
+            'Netzbezug_Defizit': defizit,
+        }
 
         # 3. Berechne Jahresergebnisse und Kosten
-        jahres_erzeugung = df['Erzeugung'].sum()
-        jahres_selbstversorgung = df['Selbstversorgung'].sum()
+        jahres_erzeugung = erzeugung.sum()
+        jahres_selbstversorgung = selbstversorgung.sum()
         
         h2_produktionsstunden = jahres_selbstversorgung / elektrolyseure[0].nennleistung_kw
         h2_produktion_kg_pa = h2_produktionsstunden * elektrolyseure[0].h2_produktionsrate_kg_h
         
-        gesamte_investition = sum(k.investitionskosten for k in self.alle_komponenten)
-        kosten = {
-            'Abschreibung': sum(k.get_abschreibung_pa() for k in self.alle_komponenten),
-            'Wartung': sum(k.get_wartung_pa() for k in self.alle_komponenten),
-            'Zinsen (Annahme)': gesamte_investition * 0.5 * 0.07,
-            # Hier könnten Kosten für Netzbezug etc. hinzukommen
-        }
-        selbstkosten_total_pa = sum(kosten.values())
+        gesamte_investition = self.kosten_jahr['Gesamtinvestition']
+        kosten = self.kosten_jahr['Kosten_pa']
+        selbstkosten_total_pa = math.fsum(kosten.values())
         gestehungskosten_pro_kg_h2 = selbstkosten_total_pa / h2_produktion_kg_pa if h2_produktion_kg_pa > 0 else float('inf')
 
         # 4. Ausgabe und Visualisierung
+        df = self._erstelle_bilanz_tabelle(bilanz)
         print("\n--- Monatliche Energiebilanz (in kWh) ---")
         print(df.round(0))
         
@@ -167,10 +387,21 @@ class WasserstoffProjekt:
         print(f"Produzierter Wasserstoff: {h2_produktion_kg_pa:,.0f} kg")
         print(f"\nGESAMTE GESTEHUNGSKOSTEN: {gestehungskosten_pro_kg_h2:.2f} €/kg H2")
 
-        self._visualisiere_bilanz(df)
+        if plot:
+            self._visualisiere_bilanz(df)
+
+    def _erstelle_bilanz_tabelle(self, bilanz: dict) -> "pd.DataFrame":
+        """Baut aus den fertig berechneten Monats-Arrays ein DataFrame für die Ausgabe."""
+        # pandas wird nur für die Tabellenausgabe gebraucht, die Rechnung läuft auf NumPy
+        import pandas as pd
+
+        return pd.DataFrame(bilanz, index=['Jan', 'Feb', 'Mär', 'Apr', 'Mai', 'Jun', 'Jul', 'Aug', 'Sep', 'Okt', 'Nov', 'Dez'])
 
-    def _visualisiere_bilanz(self, df: pd.DataFrame):
+    def _visualisiere_bilanz(self, df: "pd.DataFrame"):
         """Erstellt ein gestapeltes Balkendiagramm der monatlichen Energiebilanz."""
+        # Erst hier importieren: matplotlib kostet beim Start spürbar Zeit
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots(figsize=(12, 7))
 
         # Gestapelte Balken für Erzeugung
@@ -191,9 +422,13 @@ class WasserstoffProjekt:
 # TEIL 3: AUSFÜHRUNG
 # ----------------------------------------------------------------------------
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gestehungskosten für grünen Wasserstoff berechnen.")
+    parser.add_argument('--no-plot', action='store_true', help="Keine Grafik anzeigen (z. B. für Batch-Läufe).")
+    args = parser.parse_args()
+
     PROJEKT_BASIS_PFAD = Path(__file__).parent
     ANLAGEN_PFAD = PROJEKT_BASIS_PFAD / 'anlage'
     LASTPROFILE_PFAD = PROJEKT_BASIS_PFAD / 'lastprofile'
     
     projekt = WasserstoffProjekt(anlagen_pfad=ANLAGEN_PFAD, lastprofile_pfad=LASTPROFILE_PFAD)
-    projekt.starte_monatliche_analyse()
\ No newline at end of file
+    projekt.starte_monatliche_analyse(plot=not args.no_plot)
\ No newline at end of file